@@ -7,6 +7,8 @@ import google.generativeai as genai
 import random
 import re
 
+import monster4
+
 # You must set this API key before using the Gemini player
 GEMINI_API_KEY = None
 
@@ -128,3 +130,76 @@ Choose ONE cell to place a skeleton. Reply with ONLY the coordinates like (1, 2)
     except Exception as e:
         print(f"Gemini skeleton placement error: {e}. Using random.")
         return random.choice(valid_placements)
+
+
+# Counters for the hybrid player: how many placement decisions it made and
+# how many were resolved locally without calling the API.
+HYBRID_STATS = {"calls": 0, "local": 0}
+
+
+def _opponent(player):
+    """Return the other monster symbol."""
+    if player == monster4.Player1_Monster:
+        return monster4.Player2_Monster
+    return monster4.Player1_Monster
+
+
+def _wins_at(board, row, col, player):
+    """Return True if placing `player` at (row, col) completes a row for them."""
+    trial = [list(r) for r in board]
+    trial[1 + row][col] = player
+    return monster4.winner(trial) == player
+
+
+def tactical_placement(board, player, valid_placements):
+    """
+    Look for a forced move without asking Gemini.
+
+    Checks, in order: a single valid option, a placement that wins
+    immediately, and a placement that blocks the opponent's immediate win.
+
+    Returns:
+        (row, col) tuple if the move is forced, else None
+    """
+    if len(valid_placements) == 1:
+        return valid_placements[0]
+    for row, col in valid_placements:
+        if _wins_at(board, row, col, player):
+            return (row, col)
+    opponent = _opponent(player)
+    for row, col in valid_placements:
+        if _wins_at(board, row, col, opponent):
+            return (row, col)
+    return None
+
+
+def hybrid_choose_placement(board, face, player, valid_placements):
+    """
+    Choose a placement, only calling Gemini for genuinely open positions.
+
+    Forced moves (single option, immediate win, must-block) are answered
+    locally by `tactical_placement`; everything else goes to
+    `gemini_choose_placement`. Takes the same arguments and returns the
+    same value as `gemini_choose_placement`.
+    """
+    if not valid_placements:
+        return None
+
+    HYBRID_STATS["calls"] += 1
+    move = tactical_placement(board, player, valid_placements)
+    if move is not None:
+        HYBRID_STATS["local"] += 1
+        return move
+    return gemini_choose_placement(board, face, player, valid_placements)
+
+
+def hybrid_stats():
+    """Return the hybrid player's counters plus the share resolved locally."""
+    calls = HYBRID_STATS["calls"]
+    local = HYBRID_STATS["local"]
+    return {
+        "calls": calls,
+        "local": local,
+        "api": calls - local,
+        "local_share": local / calls if calls else 0.0,
+    }
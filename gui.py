@@ -141,7 +141,7 @@ class BoardGUI:
         if USE_GEMINI and face in ("Light Grave", "Dark Grave", "Any Grave"):
             valid = monster4._valid_placements(self.board, face=face)
             if valid:
-                r, c = gemini_player.gemini_choose_placement(
+                r, c = gemini_player.hybrid_choose_placement(
                     self.board, face, self.current, valid
                 )
                 monster4._place_monster(self.board, r, c, self.current)